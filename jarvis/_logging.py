@@ -1,12 +1,12 @@
+import logging
 import os
+import sys
+
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
 
 def configure_logging():
-    import logging
-    import sys
-
     raw_level = os.getenv("JARVIS_LOG_LEVEL", "INFO").upper()
     level = getattr(logging, raw_level, logging.INFO)
 
@@ -1,5 +1,4 @@
-import struct
-
+import numpy as np
 from rtvoice.audio import SpeakerOutput
 
 
@@ -21,10 +20,8 @@ class VolumeSpeakerOutput(SpeakerOutput):
             return chunk
         if self._volume <= 0.0:
             return b"\x00" * len(chunk)
-        num_samples = len(chunk) // 2
-        samples = struct.unpack(f"<{num_samples}h", chunk)
-        scaled = [max(-32768, min(32767, int(s * self._volume))) for s in samples]
-        return struct.pack(f"<{num_samples}h", *scaled)
+        samples = np.frombuffer(chunk, dtype="<i2")
+        return (samples * self._volume).astype("<i2").tobytes()
 
     def _playback_loop(self) -> None:
         while True:
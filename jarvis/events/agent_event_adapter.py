@@ -1,7 +1,7 @@
 from rtvoice import AgentListener
 from rtvoice.views import AgentError
 
-from rtvoice.events.bus import EventBus
+from jarvis.events.bus import EventBus
 from jarvis.events.views import (
     AgentErrorEvent,
     AgentInterruptedEvent,
@@ -18,17 +18,27 @@ from jarvis.events.views import (
 
 
 class AgentEventAdapter(AgentListener):
+    _AGENT_STARTED = AgentStartedEvent()
+    _AGENT_STOPPED = AgentStoppedEvent()
+    _AGENT_INTERRUPTED = AgentInterruptedEvent()
+    _USER_STARTED_SPEAKING = UserStartedSpeakingEvent()
+    _USER_STOPPED_SPEAKING = UserStoppedSpeakingEvent()
+    _ASSISTANT_STARTED_RESPONDING = AssistantStartedRespondingEvent()
+    _ASSISTANT_STOPPED_RESPONDING = AssistantStoppedRespondingEvent()
+    _SUPERVISOR_STARTED = SupervisorStartedEvent()
+    _SUPERVISOR_FINISHED = SupervisorFinishedEvent()
+
     def __init__(self, event_bus: EventBus) -> None:
         self._event_bus = event_bus
 
     async def on_agent_session_connected(self) -> None:
-        await self._event_bus.dispatch(AgentStartedEvent())
+        await self._event_bus.dispatch(self._AGENT_STARTED)
 
     async def on_agent_stopped(self) -> None:
-        await self._event_bus.dispatch(AgentStoppedEvent())
+        await self._event_bus.dispatch(self._AGENT_STOPPED)
 
     async def on_agent_interrupted(self) -> None:
-        await self._event_bus.dispatch(AgentInterruptedEvent())
+        await self._event_bus.dispatch(self._AGENT_INTERRUPTED)
 
     async def on_agent_error(self, error: AgentError) -> None:
         await self._event_bus.dispatch(
@@ -36,16 +46,16 @@ class AgentEventAdapter(AgentListener):
         )
 
     async def on_user_started_speaking(self) -> None:
-        await self._event_bus.dispatch(UserStartedSpeakingEvent())
+        await self._event_bus.dispatch(self._USER_STARTED_SPEAKING)
 
     async def on_user_stopped_speaking(self) -> None:
-        await self._event_bus.dispatch(UserStoppedSpeakingEvent())
+        await self._event_bus.dispatch(self._USER_STOPPED_SPEAKING)
 
     async def on_assistant_started_responding(self) -> None:
-        await self._event_bus.dispatch(AssistantStartedRespondingEvent())
+        await self._event_bus.dispatch(self._ASSISTANT_STARTED_RESPONDING)
 
     async def on_assistant_stopped_responding(self) -> None:
-        await self._event_bus.dispatch(AssistantStoppedRespondingEvent())
+        await self._event_bus.dispatch(self._ASSISTANT_STOPPED_RESPONDING)
 
     async def on_user_inactivity_countdown(self, remaining_seconds: int) -> None:
         await self._event_bus.dispatch(
@@ -53,7 +63,7 @@ class AgentEventAdapter(AgentListener):
         )
 
     async def on_supervisor_started(self) -> None:
-        await self._event_bus.dispatch(SupervisorStartedEvent())
+        await self._event_bus.dispatch(self._SUPERVISOR_STARTED)
 
     async def on_supervisor_finished(self) -> None:
-        await self._event_bus.dispatch(SupervisorFinishedEvent())
\ No newline at end of file
+        await self._event_bus.dispatch(self._SUPERVISOR_FINISHED)
\ No newline at end of file
@@ -13,24 +13,35 @@ logger = logging.getLogger(__name__)
 
 class EventBus:
     def __init__(self):
-        self._handlers: dict[type[BaseModel], list[EventHandler]] = {}
+        self._handlers: dict[type[BaseModel], tuple[EventHandler, ...]] = {}
 
     def subscribe(self, event_type: type[T], handler: EventHandler[T]) -> None:
-        self._handlers.setdefault(event_type, []).append(handler)
-        logger.debug(f"Subscribed to {event_type.__name__}")
+        self._handlers[event_type] = (*self._handlers.get(event_type, ()), handler)
+        logger.debug("Subscribed to %s", event_type.__name__)
 
     def unsubscribe(self, event_type: type[T], handler: EventHandler[T]) -> None:
-        if event_type in self._handlers and handler in self._handlers[event_type]:
-            self._handlers[event_type].remove(handler)
+        handlers = list(self._handlers.get(event_type, ()))
+        if handler in handlers:
+            handlers.remove(handler)
+            self._handlers[event_type] = tuple(handlers)
 
     async def dispatch(self, event: T) -> T:
         event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        handlers = self._handlers.get(event_type, ())
 
-        logger.debug(f"Dispatching {event_type.__name__} to {len(handlers)} handler(s)")
+        logger.debug(
+            "Dispatching %s to %d handler(s)", event_type.__name__, len(handlers)
+        )
 
         if not handlers:
-            logger.warning(f"No handlers registered for {event_type.__name__}")
+            logger.warning("No handlers registered for %s", event_type.__name__)
+            return event
+
+        if len(handlers) == 1:
+            try:
+                await handlers[0](event)
+            except Exception as e:
+                self._log_handler_failure(event_type, e)
             return event
 
         tasks = [handler(event) for handler in handlers]
@@ -38,9 +49,14 @@ class EventBus:
 
         for result in results:
             if isinstance(result, Exception):
-                logger.error(
-                    f"Handler failed for {event_type.__name__}: {result}",
-                    exc_info=result,
-                )
+                self._log_handler_failure(event_type, result)
+
+        return event
 
-        return event
\ No newline at end of file
+    def _log_handler_failure(self, event_type: type[BaseModel], error: Exception) -> None:
+        logger.error(
+            "Handler failed for %s: %s",
+            event_type.__name__,
+            error,
+            exc_info=error,
+        )
\ No newline at end of file
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Coroutine
 from datetime import datetime
 import logging
 
@@ -24,6 +25,9 @@ from jarvis.tools import Timer
 logger = logging.getLogger(__name__)
 
 class Jarvis:
+    _LISTENER_MIN_RETRY_DELAY = 0.5
+    _LISTENER_MAX_RETRY_DELAY = 30.0
+
     def __init__(
         self,
         realtime_model: RealtimeModel = RealtimeModel.GPT_REALTIME_MINI,
@@ -68,8 +72,8 @@ class Jarvis:
         self._event_bus.subscribe(AgentStopCommand, self._on_stop_command)
         self._register_core_tools()
 
-        asyncio.create_task(self._event_bus.dispatch(ApplicationStartedEvent()))
-        
+        self._spawn(self._event_bus.dispatch(ApplicationStartedEvent()))
+
     def _register_core_tools(self) -> None:
         @self._tools.action("Stop the current assistant run")
         async def stop_current_run(context: JarvisContext) -> None:
@@ -82,7 +86,7 @@ class Jarvis:
         @self._tools.action("Set the speaker volume (0-100)")
         def set_volume(context: JarvisContext, percent: int) -> str:
             context.speaker.volume = percent
-            return f"Volume set to {percent}%"
+            return f"Volume set to {context.speaker.volume}%"
 
         @self._tools.action("Get the current speaker volume")
         def get_volume(context: JarvisContext) -> str:
@@ -125,9 +129,12 @@ class Jarvis:
             logger.exception("Agent session raised an unexpected error")
         finally:
             self._agent = None
-            task = asyncio.create_task(self._prepare_next_agent())
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+            self._spawn(self._prepare_next_agent())
+
+    def _spawn(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     async def prepare(self) -> None:
         """Pre-warms the agent and starts background services.
@@ -140,8 +147,12 @@ class Jarvis:
             return
 
         logger.info("Preparing Jarvis...")
-        await self._lights_watchdog.start()
-        await self._prepare_next_agent()
+        # The Hue bridge connection and the agent prewarm are independent
+        # network round trips, so overlap them instead of paying for both.
+        await asyncio.gather(
+            self._lights_watchdog.start(),
+            self._prepare_next_agent(),
+        )
         self._prepared = True
         logger.info("Jarvis prepared and ready")
 
@@ -153,22 +164,32 @@ class Jarvis:
         """
         await self.prepare()
 
+        loop = asyncio.get_running_loop()
+        retry_delay = self._LISTENER_MIN_RETRY_DELAY
+
         while True:
+            started_at = loop.time()
             try:
                 await self._wake_word_listener.listen()
             except asyncio.CancelledError:
                 logger.info("Jarvis run loop cancelled – shutting down")
                 raise
             except Exception:
-                logger.exception("Wake word listener error – restarting listener")
+                if loop.time() - started_at > self._LISTENER_MAX_RETRY_DELAY:
+                    retry_delay = self._LISTENER_MIN_RETRY_DELAY
+                logger.exception(
+                    "Wake word listener error – restarting listener in %.1fs", retry_delay
+                )
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self._LISTENER_MAX_RETRY_DELAY)
 
     async def _on_stop_command(self, _: AgentStopCommand) -> None:
         logger.info("Stop requested via command – stopping agent...")
-        # Use ensure_future instead of await: stopping the agent cancels all running
+        # Spawn a task instead of awaiting: stopping the agent cancels all running
         # tasks, including the tool-call task that triggered this handler. Awaiting
-        # directly causes a recursive cancel loop. ensure_future defers the stop to
+        # directly causes a recursive cancel loop. The spawned task runs the stop on
         # the next event loop tick, letting the tool call finish cleanly first.
-        asyncio.ensure_future(self.stop())
+        self._spawn(self.stop())
 
     async def stop(self) -> None:
         if self._is_running():
@@ -0,0 +1,31 @@
+from rtvoice.mcp import MCPServerStdio
+
+_HUE_MCP_ALLOWED_TOOLS = [
+    # Lights
+    "turn_on_light",
+    "turn_off_light",
+    "set_light_brightness",
+    "increase_light_brightness",
+    "decrease_light_brightness",
+    "get_light_brightness",
+    "list_lights",
+    # Rooms
+    "turn_on_room",
+    "turn_off_room",
+    "set_room_brightness",
+    "increase_room_brightness",
+    "decrease_room_brightness",
+    "get_room_brightness",
+    "activate_scene_in_room",
+    "get_active_scene_in_room",
+    "list_scenes_in_room",
+    "list_rooms",
+]
+
+
+def create_hue_mcp_server() -> MCPServerStdio:
+    return MCPServerStdio(
+        command="uv",
+        args=["run", "-m", "hueify.mcp.server"],
+        allowed_tools=list(_HUE_MCP_ALLOWED_TOOLS),
+    )
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import httpx
+
+_LOCATION_TTL_SECONDS = 600
+
+_FORECAST_PARAMS = {
+    "current": "temperature_2m,apparent_temperature,precipitation,weathercode",
+    "hourly": "temperature_2m,apparent_temperature,precipitation_probability,precipitation,weathercode",
+    "forecast_days": 2,
+    "timezone": "Europe/Berlin",
+}
+
+_client = httpx.AsyncClient()
+_location_lock = asyncio.Lock()
+_cached_location: tuple[str, float] | None = None
+
+
+async def get_user_location() -> str:
+    global _cached_location
+
+    async with _location_lock:
+        if _cached_location is not None:
+            location, fetched_at = _cached_location
+            if time.monotonic() - fetched_at < _LOCATION_TTL_SECONDS:
+                return location
+
+        response = await _client.get("https://ipapi.co/json/")
+        data = response.json()
+        location = f"{data['city']}, {data['region']}, {data['country_name']}"
+        _cached_location = (location, time.monotonic())
+        return location
+
+
+async def fetch_weather(location: str) -> str:
+    geo = await _client.get(
+        "https://geocoding-api.open-meteo.com/v1/search",
+        params={"name": location, "count": 1, "language": "en"},
+    )
+    results = geo.json().get("results")
+    if not results:
+        return f"Location '{location}' not found."
+
+    r = results[0]
+    lat, lon = r["latitude"], r["longitude"]
+
+    weather = await _client.get(
+        "https://api.open-meteo.com/v1/forecast",
+        params={"latitude": lat, "longitude": lon, **_FORECAST_PARAMS},
+    )
+    data = weather.json()
+    current = data["current"]
+    hourly = data["hourly"]
+
+    hours = hourly["time"]
+    hourly_lines = []
+    for i in range(0, len(hours), 3):
+        hourly_lines.append(
+            f"  {hours[i]}: {hourly['temperature_2m'][i]}°C, "
+            f"rain chance {hourly['precipitation_probability'][i]}%"
+        )
+
+    return (
+        f"Location: {r['name']}, {r['country_code']}\n\n"
+        f"Current conditions:\n"
+        f"  Temperature: {current['temperature_2m']}°C "
+        f"(feels like {current['apparent_temperature']}°C)\n"
+        f"  Precipitation: {current['precipitation']}mm\n\n"
+        f"Hourly forecast (next 48h):\n"
+        + "\n".join(hourly_lines)
+    )
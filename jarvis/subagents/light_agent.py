@@ -2,7 +2,8 @@ import logging
 
 from hueify import Hueify
 from rtvoice import SubAgent
-from rtvoice.mcp import MCPServerStdio
+
+from jarvis.subagents._hue import create_hue_mcp_server
 
 logger = logging.getLogger(__name__)
 
@@ -43,33 +44,7 @@ async def create_light_agent(llm) -> SubAgent:
             "Use for any lighting request: on/off, brightness, color temperature, scenes."
         ),
         instructions=instructions,
-        mcp_servers=[
-            MCPServerStdio(
-                command="uv",
-                args=["run", "-m", "hueify.mcp.server"],
-                allowed_tools=[
-                # Lights
-                "turn_on_light",
-                "turn_off_light",
-                "set_light_brightness",
-                "increase_light_brightness",
-                "decrease_light_brightness",
-                "get_light_brightness",
-                "list_lights",
-                # Rooms
-                "turn_on_room",
-                "turn_off_room",
-                "set_room_brightness",
-                "increase_room_brightness",
-                "decrease_room_brightness",
-                "get_room_brightness",
-                "activate_scene_in_room",
-                "get_active_scene_in_room",
-                "list_scenes_in_room",
-                "list_rooms",
-                ],
-            ),
-        ],
+        mcp_servers=[create_hue_mcp_server()],
         llm=llm,
         handoff_instructions=(
             "Use this agent when the user wants to control lights, "
@@ -1,18 +1,13 @@
+import asyncio
 from datetime import datetime
 from typing import Annotated
 
-import httpx
 from hueify import Hueify
-from rtvoice.mcp import MCPServerStdio
 from rtvoice.supervisor import SupervisorAgent
 from rtvoice.tools import SupervisorTools
 
-
-async def _get_user_location() -> str:
-    async with httpx.AsyncClient() as client:
-        response = await client.get("https://ipapi.co/json/")
-        data = response.json()
-        return f"{data['city']}, {data['region']}, {data['country_name']}"
+from jarvis.subagents._hue import create_hue_mcp_server
+from jarvis.subagents._weather import fetch_weather, get_user_location
 
 
 def _build_tools() -> SupervisorTools:
@@ -27,7 +22,7 @@ def _build_tools() -> SupervisorTools:
         "Always call this first before fetching weather."
     )
     async def get_current_location() -> str:
-        return await _get_user_location()
+        return await get_user_location()
 
     @tools.action(
         "Fetch current weather and hourly forecast for a given location. "
@@ -37,83 +32,52 @@ def _build_tools() -> SupervisorTools:
     async def get_weather(
         location: Annotated[str, "City name, e.g. 'Muenster, Germany'"],
     ) -> str:
-        async with httpx.AsyncClient() as client:
-            geo = await client.get(
-                "https://geocoding-api.open-meteo.com/v1/search",
-                params={"name": location, "count": 1, "language": "en"},
-            )
-            results = geo.json().get("results")
-            if not results:
-                return f"Location '{location}' not found."
-
-            result = results[0]
-            lat, lon = result["latitude"], result["longitude"]
-
-            weather = await client.get(
-                "https://api.open-meteo.com/v1/forecast",
-                params={
-                    "latitude": lat,
-                    "longitude": lon,
-                    "current": "temperature_2m,apparent_temperature,precipitation,weathercode",
-                    "hourly": "temperature_2m,apparent_temperature,precipitation_probability,precipitation,weathercode",
-                    "forecast_days": 2,
-                    "timezone": "Europe/Berlin",
-                },
-            )
-            data = weather.json()
-            current = data["current"]
-            hourly = data["hourly"]
-
-            hours = hourly["time"]
-            hourly_lines = []
-            for i in range(0, len(hours), 3):
-                hourly_lines.append(
-                    f"  {hours[i]}: {hourly['temperature_2m'][i]} degC, "
-                    f"rain chance {hourly['precipitation_probability'][i]}%"
-                )
-
-            return (
-                f"Location: {result['name']}, {result['country_code']}\\n\\n"
-                f"Current conditions:\\n"
-                f"  Temperature: {current['temperature_2m']} degC "
-                f"(feels like {current['apparent_temperature']} degC)\\n"
-                f"  Precipitation: {current['precipitation']}mm\\n\\n"
-                f"Hourly forecast (next 48h):\\n"
-                + "\\n".join(hourly_lines)
-            )
+        return await fetch_weather(location)
 
     return tools
 
 
 def _build_instructions(location: str, lights: list[str], rooms: list[str], zones: list[str]) -> str:
-    return (
-        "You are Jarvis's supervisor agent. You can handle weather and Philips Hue lighting tasks.\\n\\n"
-        f"The user's current location is: {location}\\n\\n"
-        "Weather behavior:\\n"
-        "- Use this location by default unless the user explicitly asks for another city.\\n"
-        "- Answer based on requested time window (current, afternoon, evening, tomorrow).\\n"
-        "- Keep weather results concise and focused on temperature feel and rain.\\n\\n"
-        "Lighting behavior:\\n"
-        "- Use MCP Hue tools to control lights.\\n"
-        "- Prefer rooms/zones over individual lights unless the user asks for a specific light.\\n"
-        "- Confirm the performed action in one short sentence.\\n\\n"
-        "Available Hue resources:\\n"
-        f"- Lights: {', '.join(lights) if lights else 'none'}\\n"
-        f"- Rooms: {', '.join(rooms) if rooms else 'none'}\\n"
-        f"- Zones: {', '.join(zones) if zones else 'none'}"
-    )
+    sections = [
+        "You are Jarvis's supervisor agent. You can handle weather and Philips Hue lighting tasks.",
+        "",
+        f"The user's current location is: {location}",
+        "",
+        "Weather behavior:",
+        "- Use this location by default unless the user explicitly asks for another city.",
+        "- Answer based on requested time window (current, afternoon, evening, tomorrow).",
+        "- Keep weather results concise and focused on temperature feel and rain.",
+        "",
+        "Lighting behavior:",
+        "- Use MCP Hue tools to control lights.",
+        "- Prefer rooms/zones over individual lights unless the user asks for a specific light.",
+        "- Confirm the performed action in one short sentence.",
+        "",
+        "Available Hue resources:",
+        f"- Lights: {', '.join(lights) if lights else 'none'}",
+        f"- Rooms: {', '.join(rooms) if rooms else 'none'}",
+        f"- Zones: {', '.join(zones) if zones else 'none'}",
+    ]
+    return "\n".join(sections)
+
+
+async def _get_hue_resources() -> tuple[list[str], list[str], list[str]]:
+    async with Hueify() as hueify:
+        return hueify.lights.names, hueify.rooms.names, hueify.zones.names
 
 
 async def create_supervisor_agent(llm) -> SupervisorAgent:
-    location = await _get_user_location()
-
-    async with Hueify() as hueify:
-        instructions = _build_instructions(
-            location=location,
-            lights=hueify.lights.names,
-            rooms=hueify.rooms.names,
-            zones=hueify.zones.names,
-        )
+    async with asyncio.TaskGroup() as tg:
+        location_task = tg.create_task(get_user_location())
+        hue_task = tg.create_task(_get_hue_resources())
+
+    lights, rooms, zones = hue_task.result()
+    instructions = _build_instructions(
+        location=location_task.result(),
+        lights=lights,
+        rooms=rooms,
+        zones=zones,
+    )
 
     return SupervisorAgent(
         name="Jarvis Supervisor",
@@ -125,31 +89,7 @@ async def create_supervisor_agent(llm) -> SupervisorAgent:
         instructions=instructions,
         tools=_build_tools(),
         llm=llm,
-        mcp_servers=[
-            MCPServerStdio(
-                command="uv",
-                args=["run", "-m", "hueify.mcp.server"],
-                allowed_tools=[
-                    "turn_on_light",
-                    "turn_off_light",
-                    "set_light_brightness",
-                    "increase_light_brightness",
-                    "decrease_light_brightness",
-                    "get_light_brightness",
-                    "list_lights",
-                    "turn_on_room",
-                    "turn_off_room",
-                    "set_room_brightness",
-                    "increase_room_brightness",
-                    "decrease_room_brightness",
-                    "get_room_brightness",
-                    "activate_scene_in_room",
-                    "get_active_scene_in_room",
-                    "list_scenes_in_room",
-                    "list_rooms",
-                ],
-            ),
-        ],
+        mcp_servers=[create_hue_mcp_server()],
         handoff_instructions=(
             "Use this agent when the user asks about weather or controlling Hue lights."
         ),
@@ -1,16 +1,9 @@
 from datetime import datetime
 from typing import Annotated
 
-import httpx
-
 from rtvoice import SubAgent, Tools
-from llmify import ChatOpenAI
 
-async def _get_user_location() -> str:
-    async with httpx.AsyncClient() as client:
-        response = await client.get("https://ipapi.co/json/")
-        data = response.json()
-        return f"{data['city']}, {data['region']}, {data['country_name']}"
+from jarvis.subagents._weather import fetch_weather, get_user_location
 
 
 def _build_weather_tools() -> Tools:
@@ -25,7 +18,7 @@ def _build_weather_tools() -> Tools:
         "Always call this first before fetching weather."
     )
     async def get_current_location() -> str:
-        return await _get_user_location()
+        return await get_user_location()
 
     @tools.action(
         "Fetch current weather and hourly forecast for a given location. "
@@ -35,56 +28,13 @@ def _build_weather_tools() -> Tools:
     async def get_weather(
         location: Annotated[str, "City name, e.g. 'Münster, Germany'"],
     ) -> str:
-        async with httpx.AsyncClient() as client:
-            geo = await client.get(
-                "https://geocoding-api.open-meteo.com/v1/search",
-                params={"name": location, "count": 1, "language": "en"},
-            )
-            results = geo.json().get("results")
-            if not results:
-                return f"Location '{location}' not found."
-
-            r = results[0]
-            lat, lon = r["latitude"], r["longitude"]
-
-            weather = await client.get(
-                "https://api.open-meteo.com/v1/forecast",
-                params={
-                    "latitude": lat,
-                    "longitude": lon,
-                    "current": "temperature_2m,apparent_temperature,precipitation,weathercode",
-                    "hourly": "temperature_2m,apparent_temperature,precipitation_probability,precipitation,weathercode",
-                    "forecast_days": 2,
-                    "timezone": "Europe/Berlin",
-                },
-            )
-            data = weather.json()
-            current = data["current"]
-            hourly = data["hourly"]
-
-            hours = hourly["time"]
-            hourly_lines = []
-            for i in range(0, len(hours), 3):
-                hourly_lines.append(
-                    f"  {hours[i]}: {hourly['temperature_2m'][i]}°C, "
-                    f"rain chance {hourly['precipitation_probability'][i]}%"
-                )
-
-            return (
-                f"Location: {r['name']}, {r['country_code']}\n\n"
-                f"Current conditions:\n"
-                f"  Temperature: {current['temperature_2m']}°C "
-                f"(feels like {current['apparent_temperature']}°C)\n"
-                f"  Precipitation: {current['precipitation']}mm\n\n"
-                f"Hourly forecast (next 48h):\n"
-                + "\n".join(hourly_lines)
-            )
+        return await fetch_weather(location)
 
     return tools
 
 
 async def _build_instructions() -> str:
-    location = await _get_user_location()
+    location = await get_user_location()
 
     return (
         "You are a weather assistant.\n\n"
@@ -107,7 +57,7 @@ async def _build_instructions() -> str:
     )
 
 
-async def create_weather_agent() -> SubAgent:
+async def create_weather_agent(llm) -> SubAgent:
     return SubAgent(
         name="Weather Agent",
         description=(
@@ -117,6 +67,6 @@ async def create_weather_agent() -> SubAgent:
         ),
         instructions=await _build_instructions(),
         tools=_build_weather_tools(),
-        llm=ChatOpenAI(model="gpt-4o-mini", temperature=0.2),
+        llm=llm,
         handoff_instructions="Always ask only: 'What is the weather like today?' – do not include any location.",
     )
\ No newline at end of file
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -13,13 +14,13 @@ class TimerState(StrEnum):
     RINGING = "ringing"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     success: bool
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerStatus:
     state: TimerState
     remaining_seconds: int | None = None
@@ -28,11 +29,12 @@ class TimerStatus:
 
 class Timer:
     _TIMER_SOUND = str(files("jarvis.sounds").joinpath("timer_ringing.mp3"))
+    _NS_PER_SECOND = 1_000_000_000
 
     def __init__(self) -> None:
         self._state = TimerState.IDLE
         self._task: asyncio.Task | None = None
-        self._remaining: int | None = None
+        self._deadline_ns: int | None = None
         self._duration: int | None = None
 
         self._ring_data, self._samplerate = sf.read(self._TIMER_SOUND, dtype="float32")
@@ -43,6 +45,7 @@ class Timer:
             return ActionResult(success=False, message="A timer is already running. Please delete it first.")
 
         self._duration = seconds
+        self._deadline_ns = time.monotonic_ns() + seconds * self._NS_PER_SECOND
         self._state = TimerState.RUNNING
         self._task = asyncio.create_task(self._run(seconds))
 
@@ -76,23 +79,25 @@ class Timer:
         sd.stop()
         self._state = TimerState.IDLE
         self._duration = None
-        self._remaining = None
+        self._deadline_ns = None
         return ActionResult(success=True, message="Timer deleted.")
 
     def status(self) -> TimerStatus:
         return TimerStatus(
             state=self._state,
-            remaining_seconds=self._remaining,
+            remaining_seconds=self._remaining_seconds(),
             duration_seconds=self._duration,
         )
 
+    def _remaining_seconds(self) -> int | None:
+        if self._deadline_ns is None:
+            return None
+        remaining_ns = self._deadline_ns - time.monotonic_ns()
+        return max(0, -(-remaining_ns // self._NS_PER_SECOND))
+
     async def _run(self, seconds: int) -> None:
-        self._remaining = seconds
         try:
-            while self._remaining > 0:
-                await asyncio.sleep(1)
-                self._remaining -= 1
-
+            await asyncio.sleep(seconds)
             self._state = TimerState.RINGING
             self._ring_task = asyncio.create_task(self._ring())
         except asyncio.CancelledError:
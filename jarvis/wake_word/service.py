@@ -4,6 +4,7 @@ import logging
 import signal
 import sys
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -19,6 +20,14 @@ CHUNK = 1280
 RATE = 16000
 CHANNELS = 1
 
+STREAM_CONFIG = {
+    "rate": RATE,
+    "channels": CHANNELS,
+    "format": pyaudio.paInt16,
+    "input": True,
+    "frames_per_buffer": CHUNK,
+}
+
 MODELS_DIR = Path(openwakeword.__file__).parent / "resources" / "models"
 
 
@@ -38,12 +47,11 @@ class WakeWordListener:
         model_path = MODELS_DIR / WAKE_WORD_MODEL[wake_word]
         self._model = Model(wakeword_model_paths=[str(model_path)])
         self._pa = pyaudio.PyAudio()
-        self._stream = self._pa.open(
-            rate=RATE,
-            channels=CHANNELS,
-            format=pyaudio.paInt16,
-            input=True,
-            frames_per_buffer=CHUNK,
+        self._stream = self._open_stream()
+        # Blocking reads get their own thread so they never queue behind sound
+        # effect or timer playback parked in the default executor.
+        self._capture_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="wake-word-capture"
         )
 
     async def listen(self) -> None:
@@ -58,7 +66,7 @@ class WakeWordListener:
         while True:
             try:
                 pcm = await loop.run_in_executor(
-                    None,
+                    self._capture_executor,
                     functools.partial(self._stream.read, CHUNK, exception_on_overflow=False),
                 )
             except OSError as e:
@@ -74,13 +82,10 @@ class WakeWordListener:
             self._stream.close()
         except Exception:
             pass
-        self._stream = self._pa.open(
-            rate=RATE,
-            channels=CHANNELS,
-            format=pyaudio.paInt16,
-            input=True,
-            frames_per_buffer=CHUNK,
-        )
+        self._stream = self._open_stream()
+
+    def _open_stream(self) -> pyaudio.Stream:
+        return self._pa.open(**STREAM_CONFIG)
 
     async def _process_audio(self, pcm: bytes) -> None:
         audio = np.frombuffer(pcm, dtype=np.int16)
@@ -108,4 +113,5 @@ class WakeWordListener:
         self._stream.stop_stream()
         self._stream.close()
         self._pa.terminate()
+        self._capture_executor.shutdown(wait=False)
         sys.exit(0)
\ No newline at end of file
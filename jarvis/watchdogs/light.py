@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections.abc import Coroutine
 
 from hueify import Hueify, Light
 
@@ -31,6 +32,7 @@ class LightsWatchdog:
         self._light: Light | None = None
         self._hueify: Hueify | None = None
         self._agent_started_event: asyncio.Event | None = None
+        self._background_tasks: set[asyncio.Task] = set()
 
     @property
     def is_connected(self) -> bool:
@@ -51,13 +53,21 @@ class LightsWatchdog:
         if self.is_connected:
             await self._hueify.close()
 
+    def _spawn(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def _on_wake_word_detected(self, _: WakeWordDetectedEvent) -> None:
         if not self._is_ready:
             return
         self._agent_started_event = asyncio.Event()
-        asyncio.create_task(self._flash())
+        self._spawn(self._flash())
 
     async def _on_agent_started(self, _: AgentStartedEvent) -> None:
+        self._release_wake_flash()
+
+    def _release_wake_flash(self) -> None:
         if self._agent_started_event is not None:
             self._agent_started_event.set()
 
@@ -71,9 +81,10 @@ class LightsWatchdog:
         logger.warning(
             "AgentErrorEvent received – type=%s message=%s", event.type, event.message
         )
+        self._release_wake_flash()
         if not self._is_ready:
             return
-        asyncio.create_task(self._flash_error())
+        self._spawn(self._flash_error())
 
     async def _flash_error(self) -> None:
         for _ in range(3):
@@ -85,7 +96,7 @@ class LightsWatchdog:
     async def _on_agent_interrupted(self, _: AgentInterruptedEvent) -> None:
         if not self._is_ready:
             return
-        asyncio.create_task(self._flash_interrupted())
+        self._spawn(self._flash_interrupted())
 
     async def _flash_interrupted(self) -> None:
         await self._light.decrease_brightness(30)
@@ -93,9 +104,10 @@ class LightsWatchdog:
         await self._light.increase_brightness(30)
 
     async def _on_agent_stopped(self, _: AgentStoppedEvent) -> None:
+        self._release_wake_flash()
         if not self._is_ready:
             return
-        asyncio.create_task(self._flash_stopped())
+        self._spawn(self._flash_stopped())
 
     async def _flash_stopped(self) -> None:
         await self._light.decrease_brightness(20)
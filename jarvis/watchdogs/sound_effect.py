@@ -1,6 +1,6 @@
 import asyncio
 import logging
-import threading
+from collections.abc import Coroutine
 from importlib.resources import files
 
 import sounddevice as sd
@@ -49,25 +49,26 @@ class SoundEffectWatchdog:
             self._SESSION_TIMEOUT_SOUND, dtype="float32"
         )
 
-        self._playback_lock = threading.Lock()
+        self._playback_lock = asyncio.Lock()
         self._session_timeout_task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
 
     async def _on_application_started(self, _: ApplicationStartedEvent) -> None:
         logger.info("ApplicationStartedEvent received – playing startup sound")
-        asyncio.create_task(self._play(self._application_started_data))
+        self._spawn(self._play(self._application_started_data))
 
     async def _on_wake_word_detected(self, _: WakeWordDetectedEvent) -> None:
         logger.info("WakeWordDetectedEvent received – playing wake sound")
-        asyncio.create_task(self._play(self._wake_data))
+        self._spawn(self._play(self._wake_data))
 
     async def _on_agent_started(self, _: AgentStartedEvent) -> None:
         logger.info("AgentStartedEvent received – playing voice assistant started sound")
-        asyncio.create_task(self._play(self._voice_assistant_started_data))
+        self._spawn(self._play(self._voice_assistant_started_data))
 
     async def _on_agent_stopped(self, _: AgentStoppedEvent) -> None:
         self._stop_session_timeout_sound()
         logger.info("AgentStoppedEvent received – playing stopped sound")
-        asyncio.create_task(self._play(self._stopped_data))
+        self._spawn(self._play(self._stopped_data))
 
     async def _on_agent_error(self, event: AgentErrorEvent) -> None:
         logger.warning(
@@ -98,13 +99,18 @@ class SoundEffectWatchdog:
             sd.stop()
         self._session_timeout_task = None
 
+    def _spawn(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def _play(self, data) -> None:
         logger.debug("Playing sound effect (%d frames)", len(data))
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._play_blocking, data)
+        async with self._playback_lock:
+            await loop.run_in_executor(None, self._play_blocking, data)
         logger.debug("Sound effect playback finished")
 
     def _play_blocking(self, data) -> None:
-        with self._playback_lock:
-            sd.stop()
-            sd.play(data, self._samplerate, blocking=True)
\ No newline at end of file
+        sd.stop()
+        sd.play(data, self._samplerate, blocking=True)
\ No newline at end of file
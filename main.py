@@ -7,13 +7,16 @@ from rtvoice.views import NoiseReduction
 from jarvis import Jarvis, WakeWord, configure_logging
 from jarvis.subagents import create_supervisor_agent
 
-configure_logging()
 
-logging.getLogger("httpcore").setLevel(logging.WARNING)
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("websockets").setLevel(logging.WARNING)
-logging.getLogger("openai").setLevel(logging.WARNING)
-logging.getLogger("hueify").setLevel(logging.WARNING)
+def _configure_logging() -> None:
+    configure_logging()
+
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("websockets").setLevel(logging.WARNING)
+    logging.getLogger("openai").setLevel(logging.WARNING)
+    logging.getLogger("hueify").setLevel(logging.WARNING)
+
 
 async def main() -> None:
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
@@ -39,4 +42,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    _configure_logging()
     asyncio.run(main())